@@ -1,13 +1,60 @@
 """API client for Snowflake Status API."""
 
-from datetime import datetime, timedelta
+import operator
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
+import orjson
 import requests
 import streamlit as st
+import urllib3
+from requests.adapters import HTTPAdapter
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from urllib3.util import Retry
 
-from .config import API_BASE_URL, API_TIMEOUT, CACHE_TTL
-from .models import Component, Incident, Maintenance
+from .config import (
+    API_BASE_URL,
+    API_TIMEOUT,
+    API_USER_AGENT,
+    COMPONENTS_TTL,
+    INCIDENTS_TTL,
+    MAINTENANCE_TTL,
+    SUMMARY_TTL,
+)
+from .models import Component, Incident, Maintenance, StatusSnapshot
+
+# Maintenance statuses, as reported by scheduled-maintenances.json
+_ACTIVE_MAINT_STATUSES = frozenset({"in_progress", "verifying"})
+_UPCOMING_MAINT_STATUS = "scheduled"
+
+
+def _active_maintenance(maintenances: list[Maintenance]) -> list[Maintenance]:
+    """Filter maintenance windows to those currently in progress."""
+    return [m for m in maintenances if m.status in _ACTIVE_MAINT_STATUSES]
+
+
+def _upcoming_maintenance(maintenances: list[Maintenance]) -> list[Maintenance]:
+    """Filter maintenance windows to those not yet started."""
+    return [m for m in maintenances if m.status == _UPCOMING_MAINT_STATUS]
+
+
+def _reload_if_stale(
+    load: Callable[[], tuple[float, list[Maintenance]]], ttl: float
+) -> list[Maintenance]:
+    """
+    Return a disk-persisted (fetched_at, value) entry, refetching it once older than ttl.
+
+    Streamlit ignores ttl on persist="disk" caches, so persisted loaders stamp their
+    results and stale entries are cleared here instead.
+    """
+    fetched_at, value = load()
+    if time.time() - fetched_at > ttl:
+        load.clear()
+        fetched_at, value = load()
+    return value
 
 
 class SnowflakeStatusAPI:
@@ -18,121 +65,155 @@ class SnowflakeStatusAPI:
         self.base_url = base_url
         self.timeout = timeout
 
+        # Reuse one keep-alive connection pool for every endpoint
+        self._session = requests.Session()
+        self._session.headers["User-Agent"] = API_USER_AGENT
+        retries = Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries),
+        )
+
     def _get(self, endpoint: str) -> dict[str, Any] | None:
         """Make GET request to API endpoint with error handling."""
         try:
             url = f"{self.base_url}/{endpoint}"
-            response = requests.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.Timeout:
+            # Stream so orjson parses the raw body without Response.content buffering it
+            with self._session.get(url, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+                return orjson.loads(response.raw.read(decode_content=True))
+        except (requests.exceptions.Timeout, urllib3.exceptions.TimeoutError):
             st.error(f"Request timed out after {self.timeout} seconds")
             return None
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
             st.error(f"API request failed: {str(e)}")
             return None
-        except ValueError as e:
+        except (orjson.JSONDecodeError, ValueError) as e:
             st.error(f"Failed to parse API response: {str(e)}")
             return None
 
-    @st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+    @st.cache_data(ttl=SUMMARY_TTL, show_spinner=False)
     def get_summary(_self) -> dict[str, Any] | None:
         """Get status summary including components and incidents."""
         return _self._get("summary.json")
 
-    @st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+    # Lists read on every rerun are cached with cache_resource so they are returned
+    # by reference instead of copied; callers must treat them as read-only.
+    @st.cache_resource(ttl=COMPONENTS_TTL, show_spinner=False)
     def get_components(_self) -> list[Component]:
         """Get all components with status information."""
         data = _self._get("components.json")
         if not data or "components" not in data:
             return []
 
-        components = []
-        for comp_data in data["components"]:
-            try:
-                components.append(Component.from_api(comp_data))
-            except Exception:
-                continue  # Skip malformed components
-
-        return components
+        # Skip malformed components
+        return [
+            c
+            for c in (Component.try_from_api(d, lite=True) for d in data["components"])
+            if c is not None
+        ]
 
-    @st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+    @st.cache_resource(ttl=INCIDENTS_TTL, show_spinner=False)
     def get_incidents(_self, days: int = 30) -> list[Incident]:
         """Get incidents from the last N days."""
         data = _self._get("incidents.json")
         if not data or "incidents" not in data:
             return []
 
-        # Filter to incidents within time window
-        cutoff = datetime.now() - timedelta(days=days)
+        # Filter to incidents within time window before parsing their updates
+        cutoff = datetime.now(UTC) - timedelta(days=days)
         incidents = []
 
         for inc_data in data["incidents"]:
-            try:
-                incident = Incident.from_api(inc_data)
-                # Include if created within time window or still unresolved
-                if (
-                    incident.created_at
-                    and incident.created_at >= cutoff
-                    or incident.resolved_at is None
-                ):
-                    incidents.append(incident)
-            except Exception:
+            if not isinstance(inc_data, dict):
                 continue
 
-        # Sort by created_at descending (most recent first)
-        incidents.sort(key=lambda x: x.created_at or datetime.min, reverse=True)
-        return incidents
-
-    @st.cache_data(ttl=CACHE_TTL, show_spinner=False)
-    def get_active_maintenance(_self) -> list[Maintenance]:
-        """Get active maintenance windows."""
-        data = _self._get("scheduled-maintenances/active.json")
-        if not data or "scheduled_maintenances" not in data:
-            return []
-
-        maintenances = []
-        for maint_data in data["scheduled_maintenances"]:
-            try:
-                maintenances.append(Maintenance.from_api(maint_data))
-            except Exception:
+            # Keep incidents created within the window or still unresolved
+            created_at = Incident.peek_created_at(inc_data)
+            if inc_data.get("resolved_at") and (created_at is None or created_at < cutoff):
                 continue
+            incident = Incident.try_from_api(inc_data)
+            if incident is not None:
+                incidents.append(incident)
 
-        return maintenances
+        # Sort by created_at descending (most recent first), undated last
+        dated = [i for i in incidents if i.created_at]
+        undated = [i for i in incidents if not i.created_at]
+        dated.sort(key=operator.attrgetter("created_at"), reverse=True)
+        return dated + undated
 
-    @st.cache_data(ttl=CACHE_TTL, show_spinner=False)
-    def get_upcoming_maintenance(_self) -> list[Maintenance]:
-        """Get upcoming maintenance windows."""
-        data = _self._get("scheduled-maintenances/upcoming.json")
-        if not data or "scheduled_maintenances" not in data:
-            return []
-
-        maintenances = []
-        for maint_data in data["scheduled_maintenances"]:
-            try:
-                maintenances.append(Maintenance.from_api(maint_data))
-            except Exception:
-                continue
+    def get_active_maintenance(self) -> list[Maintenance]:
+        """Get active maintenance windows."""
+        return _active_maintenance(self.get_all_maintenance())
 
-        return maintenances
+    def get_upcoming_maintenance(self) -> list[Maintenance]:
+        """Get upcoming maintenance windows."""
+        return _upcoming_maintenance(self.get_all_maintenance())
 
-    @st.cache_data(ttl=CACHE_TTL, show_spinner=False)
-    def get_all_maintenance(_self) -> list[Maintenance]:
+    def get_all_maintenance(self) -> list[Maintenance]:
         """Get all recent maintenance windows."""
+        return _reload_if_stale(self._load_all_maintenance, MAINTENANCE_TTL)
+
+    # Maintenance persists to disk so it survives app restarts
+    @st.cache_data(persist="disk", show_spinner=False)
+    def _load_all_maintenance(_self) -> tuple[float, list[Maintenance]]:
+        """Fetch all recent maintenance windows, stamped with the fetch time."""
+        fetched_at = time.time()
         data = _self._get("scheduled-maintenances.json")
         if not data or "scheduled_maintenances" not in data:
-            return []
+            return fetched_at, []
+
+        maintenances = [
+            m
+            for m in (Maintenance.try_from_api(d) for d in data["scheduled_maintenances"])
+            if m is not None
+        ]
+
+        # Sort by scheduled_for descending, unscheduled last
+        dated = [m for m in maintenances if m.scheduled_for]
+        undated = [m for m in maintenances if not m.scheduled_for]
+        dated.sort(key=operator.attrgetter("scheduled_for"), reverse=True)
+        return fetched_at, dated + undated
+
+    def clear_cache(self) -> None:
+        """Drop every cached response so the next call refetches from the API."""
+        self.get_summary.clear()
+        self.get_components.clear()
+        self.get_incidents.clear()
+        self._load_all_maintenance.clear()
+
+    def prefetch_all(self, days: int = 30, include_incidents: bool = True) -> StatusSnapshot:
+        """
+        Fetch every endpoint concurrently and bundle the parsed results.
+
+        Pages that don't show incidents pass include_incidents=False to skip that
+        request; the snapshot then carries an empty incident list.
+        """
+        # Each getter keeps its own cache; workers need the script context to use it
+        ctx = get_script_run_ctx()
+        with ThreadPoolExecutor(
+            max_workers=4 if include_incidents else 3,
+            initializer=add_script_run_ctx,
+            initargs=(None, ctx),
+        ) as pool:
+            summary = pool.submit(self.get_summary)
+            components = pool.submit(self.get_components)
+            incidents = pool.submit(self.get_incidents, days) if include_incidents else None
+            all_maintenance = pool.submit(self.get_all_maintenance)
+
+        # Active and upcoming windows are filtered from the one maintenance fetch
+        maintenances = all_maintenance.result()
+        return StatusSnapshot(
+            summary=summary.result(),
+            components=components.result(),
+            incidents=incidents.result() if incidents else [],
+            active_maintenance=_active_maintenance(maintenances),
+            upcoming_maintenance=_upcoming_maintenance(maintenances),
+            all_maintenance=maintenances,
+        )
 
-        maintenances = []
-        for maint_data in data["scheduled_maintenances"]:
-            try:
-                maintenances.append(Maintenance.from_api(maint_data))
-            except Exception:
-                continue
 
-        # Sort by scheduled_for descending
-        maintenances.sort(
-            key=lambda x: x.scheduled_for or datetime.min,
-            reverse=True,
-        )
-        return maintenances
+@st.cache_resource(show_spinner=False)
+def get_api() -> SnowflakeStatusAPI:
+    """Get the shared API client so its HTTP session is reused across reruns."""
+    return SnowflakeStatusAPI()
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import UTC, datetime
+from functools import partial
+from html import escape
+from operator import attrgetter
+from pathlib import Path
 
 import streamlit as st
 
@@ -13,8 +17,60 @@ from .config import (
     ViewMode,
     get_status_color,
 )
-from .models import Component, Incident, Maintenance
-from .utils import format_timestamp, order_services
+from .models import Incident, Maintenance, StatusMatrix
+from .utils import format_timestamp
+
+# App stylesheet, read once at import rather than on every rerun
+_CUSTOM_CSS_PATH = Path(".streamlit/style.css")
+try:
+    _CUSTOM_CSS_HTML = f"<style>{_CUSTOM_CSS_PATH.read_text(encoding='utf-8')}</style>"
+except OSError:
+    _CUSTOM_CSS_HTML = ""
+
+# HTML templates and sizes, built once at import rather than per render
+_ICON_SIZES = {"small": "1.0rem", "normal": "1.2rem", "large": "1.5rem"}
+_DOT_SIZES = {"small": "8px", "normal": "12px", "large": "16px"}
+
+_ICON_TEMPLATE = '<span style="font-size: {sz}; cursor: help;"{tip}>{icon}</span> {label}'
+_DOT_TEMPLATE = (
+    '<span style="display:inline-block;width:{sz};height:{sz};'
+    "background-color:{color};border-radius:50%;margin-right:8px;"
+    'vertical-align:middle;cursor:help;"{tip}></span>{label}'
+)
+_LEGEND_DOT_TEMPLATE = (
+    '<div style="display:flex;align-items:center;margin-bottom:0.5rem;">'
+    '<span style="display:inline-block;width:16px;height:16px;'
+    'background-color:{color};border-radius:50%;margin-right:8px;"></span>'
+    "<strong>{label}</strong></div>"
+)
+_BANNER_TEMPLATE = (
+    '<div style="padding:1.5rem;background-color:{color};color:white;'
+    'border-radius:8px;margin-bottom:1rem;font-size:1.3rem;font-weight:600;">'
+    "{description}</div>"
+)
+
+# Summary status indicator -> StatusType for the global banner
+_INDICATOR_TO_STATUS = {
+    "none": StatusType.OPERATIONAL,
+    "minor": StatusType.DEGRADED_PERFORMANCE,
+    "major": StatusType.PARTIAL_OUTAGE,
+    "critical": StatusType.MAJOR_OUTAGE,
+}
+
+# Legend order: operational first, then by severity, maintenance last
+_LEGEND_STATUSES = tuple(StatusType)
+
+# Status matrix layout: region column plus one column per service
+_MATRIX_GRID_OPEN = (
+    '<div class="status-matrix" style="display:grid;'
+    'grid-template-columns:{columns};gap:4px;align-items:center;">'
+)
+
+
+def render_custom_css() -> None:
+    """Inject the app stylesheet from .streamlit/style.css."""
+    if _CUSTOM_CSS_HTML:
+        st.markdown(_CUSTOM_CSS_HTML, unsafe_allow_html=True)
 
 
 def render_status_indicator(
@@ -34,26 +90,19 @@ def render_status_indicator(
         size: Size of indicator ("small", "normal", "large")
         tooltip: Optional tooltip text to show on hover
     """
-    label = STATUS_LABELS.get(status, "Unknown")
+    label = STATUS_LABELS.get(status, "Unknown") if show_label else ""
+    tip = f' title="{tooltip}"' if tooltip else ""
 
     if view_mode == ViewMode.ICON:
         icon = STATUS_ICONS.get(status, "?")
-        icon_size = {"small": "1.0rem", "normal": "1.2rem", "large": "1.5rem"}[size]
-        tooltip_attr = f' title="{tooltip}"' if tooltip else ""
         st.markdown(
-            f'<span style="font-size: {icon_size}; cursor: help;"{tooltip_attr}>'
-            f"{icon}</span> {label if show_label else ''}",
+            _ICON_TEMPLATE.format(sz=_ICON_SIZES[size], tip=tip, icon=icon, label=label),
             unsafe_allow_html=True,
         )
     else:
         color = get_status_color(status, view_mode)
-        dot_size = {"small": "8px", "normal": "12px", "large": "16px"}[size]
-        tooltip_attr = f' title="{tooltip}"' if tooltip else ""
         st.markdown(
-            f'<span style="display:inline-block;width:{dot_size};height:{dot_size};'
-            f"background-color:{color};border-radius:50%;margin-right:8px;"
-            f'vertical-align:middle;cursor:help;"{tooltip_attr}></span>'
-            f"{label if show_label else ''}",
+            _DOT_TEMPLATE.format(sz=_DOT_SIZES[size], color=color, tip=tip, label=label),
             unsafe_allow_html=True,
         )
 
@@ -70,28 +119,16 @@ def render_status_legend(view_mode: ViewMode) -> None:
     # Create columns for legend items
     cols = st.columns(5)
 
-    statuses = [
-        StatusType.OPERATIONAL,
-        StatusType.DEGRADED_PERFORMANCE,
-        StatusType.PARTIAL_OUTAGE,
-        StatusType.MAJOR_OUTAGE,
-        StatusType.UNDER_MAINTENANCE,
-    ]
-
-    for idx, status in enumerate(statuses):
+    is_icon_mode = view_mode == ViewMode.ICON
+    for idx, status in enumerate(_LEGEND_STATUSES):
+        label = STATUS_LABELS[status]
         with cols[idx]:
-            if view_mode == ViewMode.ICON:
-                icon = STATUS_ICONS.get(status, "?")
-                label = STATUS_LABELS.get(status, "Unknown")
-                st.markdown(f"**{icon} {label}**")
+            if is_icon_mode:
+                st.markdown(f"**{STATUS_ICONS[status]} {label}**")
             else:
                 color = get_status_color(status, view_mode)
-                label = STATUS_LABELS.get(status, "Unknown")
                 st.markdown(
-                    f'<div style="display:flex;align-items:center;margin-bottom:0.5rem;">'
-                    f'<span style="display:inline-block;width:16px;height:16px;'
-                    f'background-color:{color};border-radius:50%;margin-right:8px;"></span>'
-                    f"<strong>{label}</strong></div>",
+                    _LEGEND_DOT_TEMPLATE.format(color=color, label=label),
                     unsafe_allow_html=True,
                 )
 
@@ -107,20 +144,12 @@ def render_global_status_banner(summary: dict | None, view_mode: ViewMode) -> No
     indicator = status_info.get("indicator", "none")
 
     # Map indicator to StatusType
-    status_map = {
-        "none": StatusType.OPERATIONAL,
-        "minor": StatusType.DEGRADED_PERFORMANCE,
-        "major": StatusType.PARTIAL_OUTAGE,
-        "critical": StatusType.MAJOR_OUTAGE,
-    }
-    status = status_map.get(indicator, StatusType.OPERATIONAL)
+    status = _INDICATOR_TO_STATUS.get(indicator, StatusType.OPERATIONAL)
 
     # Render banner
     color = get_status_color(status, view_mode)
     st.markdown(
-        f'<div style="padding:1.5rem;background-color:{color};color:white;'
-        f'border-radius:8px;margin-bottom:1rem;font-size:1.3rem;font-weight:600;">'
-        f"{description}</div>",
+        _BANNER_TEMPLATE.format(color=color, description=description),
         unsafe_allow_html=True,
     )
 
@@ -158,7 +187,7 @@ def render_maintenance_banner(maintenance_list: list[Maintenance], view_mode: Vi
 
 
 def render_status_matrix(
-    region_services: dict[str, dict[str, Component]],
+    matrix: StatusMatrix,
     view_mode: ViewMode,
     cloud: str,
 ) -> None:
@@ -166,70 +195,75 @@ def render_status_matrix(
     Render status matrix for a specific cloud (region × service grid).
 
     Args:
-        region_services: {region_name: {service_name: Component}}
+        matrix: Status matrix from build_status_matrix
         view_mode: Current view mode
-        cloud: Cloud name (for display)
+        cloud: Cloud name (selects the matrix slice and is used for display)
     """
-    if not region_services:
+    regions = matrix.regions_by_cloud.get(cloud)
+    if not regions:
         st.info(f"No regions found for {cloud}")
         return
 
-    # Get all unique services across all regions, then order with canonical list
-    all_services = set()
-    for services in region_services.values():
-        all_services.update(services.keys())
-
-    services = order_services(all_services)
-    regions = sorted(region_services.keys())
-
-    # Create header row with wider region column (3:1 ratio)
-    # Region column is 3x wider than service columns for better readability
-    col_widths = [3] + [1] * len(services)
-
-    header_cols = st.columns(col_widths)
-    header_cols[0].markdown("**Region**")
-    for idx, service in enumerate(services):
-        header_cols[idx + 1].markdown(f"**{service}**")
+    # Cells are sorted by region, then by this canonical service order
+    start, end = matrix.cloud_offsets[cloud]
+    services = matrix.services_by_cloud[cloud]
 
-    st.divider()
-
-    # Render each region row
+    # Resolve cell markup and "now" once per render; each cell only fills in its tooltip
+    now = datetime.now(UTC)
+    if view_mode == ViewMode.ICON:
+        cell_by_status = {
+            s: partial(
+                _ICON_TEMPLATE.format, sz=_ICON_SIZES["normal"], icon=STATUS_ICONS[s], label=""
+            )
+            for s in StatusType
+        }
+    else:
+        cell_by_status = {
+            s: partial(
+                _DOT_TEMPLATE.format,
+                sz=_DOT_SIZES["normal"],
+                color=get_status_color(s, view_mode),
+                label="",
+            )
+            for s in StatusType
+        }
+
+    # Build the whole grid as one CSS grid so it is sent as a single element.
+    # Region column is 3x wider than service columns for better readability (3:1 ratio)
+    # Regions whose services all failed to resolve leave no service columns; repeat(0, ...)
+    # is invalid CSS, so the grid is then just the region column
+    columns = f"3fr repeat({len(services)},1fr)" if services else "3fr"
+    parts = [_MATRIX_GRID_OPEN.format(columns=columns), "<div><strong>Region</strong></div>"]
+    parts.extend(f"<div><strong>{escape(service)}</strong></div>" for service in services)
+
+    # Walk the sorted cells once, filling gaps where a region lacks a service
+    idx = start
     for region in regions:
-        cols = st.columns(col_widths)
+        parts.append(f"<div><strong>{escape(region)}</strong></div>")
 
-        # Region name
-        cols[0].markdown(f"**{region}**")
-
-        # Service status cells
-        for idx, service in enumerate(services):
-            component = region_services[region].get(service)
-
-            if not component:
-                cols[idx + 1].markdown("—")  # No data
+        for service in services:
+            if idx == end or matrix.regions[idx] != region or matrix.services[idx] != service:
+                parts.append("<div>—</div>")  # No data
                 continue
 
+            component = matrix.components[idx]
+            idx += 1
+
             # Build tooltip with status, name, and last update
-            status_label = STATUS_LABELS.get(component.status, "Unknown")
             tooltip_parts = [
-                f"Status: {status_label}",
-                f"Component: {component.name}",
+                f"Status: {STATUS_LABELS[component.status]}",
+                f"Component: {escape(component.name)}",
             ]
             if component.updated_at:
-                updated_time = format_timestamp(component.updated_at)
+                updated_time = format_timestamp(component.updated_at, now=now)
                 tooltip_parts.append(f"Last updated: {updated_time}")
-            tooltip = "\n".join(tooltip_parts)
-
-            # Render status indicator with tooltip on the icon/dot itself
-            with cols[idx + 1]:
-                render_status_indicator(
-                    component.status,
-                    view_mode,
-                    show_label=False,
-                    size="normal",
-                    tooltip=tooltip,
-                )
+            tip = ' title="{}"'.format("&#10;".join(tooltip_parts))
+
+            # Tooltip sits on the icon/dot itself
+            parts.append(f"<div>{cell_by_status[component.status](tip=tip)}</div>")
 
-        st.divider()
+    parts.append("</div>")
+    st.markdown("".join(parts), unsafe_allow_html=True)
 
 
 def render_incident_card(incident: Incident, view_mode: ViewMode) -> None:
@@ -258,11 +292,10 @@ def render_incident_card(incident: Incident, view_mode: ViewMode) -> None:
         # Incident updates
         if incident.updates:
             st.markdown("**Updates:**")
-            for update in sorted(
-                incident.updates,
-                key=lambda u: u.created_at or datetime.min,
-                reverse=True,
-            ):
+            dated = [u for u in incident.updates if u.created_at]
+            undated = [u for u in incident.updates if not u.created_at]
+            dated.sort(key=attrgetter("created_at"), reverse=True)
+            for update in dated + undated:
                 timestamp = format_timestamp(update.created_at) if update.created_at else "Unknown"
                 st.markdown(f"- **{timestamp}**: {update.body}")
 
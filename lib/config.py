@@ -24,7 +24,14 @@ class StatusType(str, Enum):
 # API Configuration
 API_BASE_URL = "https://status.snowflake.com/api/v2"
 API_TIMEOUT = 10  # seconds
-CACHE_TTL = 60  # seconds
+API_USER_AGENT = "SnowStat/0.1.0"
+
+# Per-endpoint cache TTLs (seconds), sized to how stale each feed can safely be
+SUMMARY_TTL = 60  # Overall status changes within minutes during an incident
+COMPONENTS_TTL = 60  # Component status drives the matrix, keep it as fresh as the summary
+INCIDENTS_TTL = 120  # Incident updates are posted every few minutes at most
+# One maintenance feed also drives the active banner, so it refreshes on that tier
+MAINTENANCE_TTL = 120  # Windows start and end on a schedule known in advance
 
 # Auto-refresh Configuration
 DEFAULT_REFRESH_INTERVAL = 300  # 5 minutes in seconds
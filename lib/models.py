@@ -1,13 +1,66 @@
 """Data models for Snowflake Status API responses."""
 
+from collections.abc import Callable
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Any
+from datetime import UTC, datetime
+from typing import Any, TypeVar
 
 from .config import StatusType
 
+# Direct value -> member lookup, avoiding Enum.__call__ and its ValueError on misses
+_STATUS_BY_VALUE = StatusType._value2member_map_
 
-@dataclass
+
+_T = TypeVar("_T")
+
+
+def _parse_iso(value: Any) -> datetime | None:
+    """Parse an ISO-8601 timestamp from the API as an aware datetime; None if missing or invalid."""
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    # Offset-less timestamps are taken as UTC so every parsed value compares and sorts together
+    return dt if dt.tzinfo else dt.replace(tzinfo=UTC)
+
+
+def _parse_status(data: dict[str, Any]) -> StatusType:
+    """Normalize a component status string to our enum, defaulting to operational."""
+    status = data.get("status")
+    if not isinstance(status, str):
+        return StatusType.OPERATIONAL
+    return _STATUS_BY_VALUE.get(status.lower().replace(" ", "_"), StatusType.OPERATIONAL)
+
+
+def _str_field(data: dict[str, Any], key: str, default: str = "") -> str:
+    """Read a text field, falling back to default when it is missing or not a string."""
+    value = data.get(key)
+    return value if isinstance(value, str) else default
+
+
+def _child_ids(data: dict[str, Any]) -> tuple[str, ...]:
+    """Child component IDs of a group; non-groups share the empty tuple."""
+    children = data.get("components")
+    if not data.get("group") or not isinstance(children, list):
+        return ()
+    return tuple(c for c in children if isinstance(c, str))
+
+
+def _try_parse(parse: Callable[[dict[str, Any]], _T], data: Any) -> _T | None:
+    """
+    Run a from_api parser on one API record, or return None if it is malformed.
+
+    Records must be objects with a string id; other fields are type-checked by the
+    parsers themselves, so nothing here swallows errors from the parsing code.
+    """
+    if not isinstance(data, dict) or not isinstance(data.get("id"), str):
+        return None
+    return parse(data)
+
+
+@dataclass(slots=True)
 class Component:
     """Represents a Snowflake service component."""
 
@@ -18,45 +71,47 @@ class Component:
     updated_at: datetime | None
     description: str | None = None
     group: bool = False
-    components: list[str] | None = None
+    components: tuple[str, ...] = ()
 
     @classmethod
     def from_api(cls, data: dict[str, Any]) -> "Component":
         """Parse Component from API response."""
-        # Parse updated_at timestamp
-        updated_at = None
-        if data.get("updated_at"):
-            try:
-                from dateutil import parser
-
-                updated_at = parser.parse(data["updated_at"])
-            except Exception:
-                pass
-
-        # Normalize status to our enum
-        status_str = data.get("status", "operational").lower().replace(" ", "_")
-        try:
-            status = StatusType(status_str)
-        except ValueError:
-            status = StatusType.OPERATIONAL
-
-        # Parse group and components fields
-        group = data.get("group", False)
-        components = data.get("components", []) if group else []
-
         return cls(
-            id=data.get("id", ""),
-            name=data.get("name", "Unknown"),
-            status=status,
+            id=_str_field(data, "id"),
+            name=_str_field(data, "name", "Unknown"),
+            status=_parse_status(data),
             group_id=data.get("group_id"),
-            updated_at=updated_at,
+            updated_at=_parse_iso(data.get("updated_at")),
             description=data.get("description"),
-            group=group,
-            components=components or [],
+            group=bool(data.get("group")),
+            components=_child_ids(data),
+        )
+
+    @classmethod
+    def try_from_api(cls, data: dict[str, Any], lite: bool = False) -> "Component | None":
+        """Parse Component from API response; returns None for malformed records."""
+        return _try_parse(cls.from_api_lite if lite else cls.from_api, data)
+
+    @classmethod
+    def from_api_lite(cls, data: dict[str, Any]) -> "Component":
+        """
+        Parse only the fields the status matrix reads.
+
+        description and group_id are left unset; group and components are kept
+        because build_status_matrix resolves regions from them.
+        """
+        return cls(
+            id=_str_field(data, "id"),
+            name=_str_field(data, "name", "Unknown"),
+            status=_parse_status(data),
+            group_id=None,
+            updated_at=_parse_iso(data.get("updated_at")),
+            group=bool(data.get("group")),
+            components=_child_ids(data),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class IncidentUpdate:
     """Represents an incident update/message."""
 
@@ -69,33 +124,16 @@ class IncidentUpdate:
     @classmethod
     def from_api(cls, data: dict[str, Any]) -> "IncidentUpdate":
         """Parse IncidentUpdate from API response."""
-        from dateutil import parser
-
-        created_at = None
-        display_at = None
-
-        if data.get("created_at"):
-            try:
-                created_at = parser.parse(data["created_at"])
-            except Exception:
-                pass
-
-        if data.get("display_at"):
-            try:
-                display_at = parser.parse(data["display_at"])
-            except Exception:
-                pass
-
         return cls(
-            id=data.get("id", ""),
-            status=data.get("status", ""),
-            body=data.get("body", ""),
-            created_at=created_at,
-            display_at=display_at,
+            id=_str_field(data, "id"),
+            status=_str_field(data, "status"),
+            body=_str_field(data, "body"),
+            created_at=_parse_iso(data.get("created_at")),
+            display_at=_parse_iso(data.get("display_at")),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Incident:
     """Represents a status incident."""
 
@@ -110,48 +148,39 @@ class Incident:
     updates: list[IncidentUpdate]
 
     @classmethod
-    def from_api(cls, data: dict[str, Any]) -> "Incident":
-        """Parse Incident from API response."""
-        from dateutil import parser
-
-        created_at = None
-        updated_at = None
-        resolved_at = None
-
-        if data.get("created_at"):
-            try:
-                created_at = parser.parse(data["created_at"])
-            except Exception:
-                pass
+    def peek_created_at(cls, data: dict[str, Any]) -> datetime | None:
+        """Parse only created_at, for filtering before a full from_api parse."""
+        return _parse_iso(data.get("created_at"))
 
-        if data.get("updated_at"):
-            try:
-                updated_at = parser.parse(data["updated_at"])
-            except Exception:
-                pass
-
-        if data.get("resolved_at"):
-            try:
-                resolved_at = parser.parse(data["resolved_at"])
-            except Exception:
-                pass
+    @classmethod
+    def try_from_api(cls, data: dict[str, Any]) -> "Incident | None":
+        """Parse Incident from API response; returns None for malformed records."""
+        return _try_parse(cls.from_api, data)
 
-        updates = [IncidentUpdate.from_api(update) for update in data.get("incident_updates", [])]
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> "Incident":
+        """Parse Incident from API response."""
+        raw_updates = data.get("incident_updates")
+        updates = (
+            [IncidentUpdate.from_api(u) for u in raw_updates if isinstance(u, dict)]
+            if isinstance(raw_updates, list)
+            else []
+        )
 
         return cls(
-            id=data.get("id", ""),
-            name=data.get("name", "Unnamed Incident"),
-            status=data.get("status", ""),
-            impact=data.get("impact", ""),
-            created_at=created_at,
-            updated_at=updated_at,
-            resolved_at=resolved_at,
+            id=_str_field(data, "id"),
+            name=_str_field(data, "name", "Unnamed Incident"),
+            status=_str_field(data, "status"),
+            impact=_str_field(data, "impact"),
+            created_at=_parse_iso(data.get("created_at")),
+            updated_at=_parse_iso(data.get("updated_at")),
+            resolved_at=_parse_iso(data.get("resolved_at")),
             shortlink=data.get("shortlink"),
             updates=updates,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Maintenance:
     """Represents a scheduled maintenance window."""
 
@@ -165,36 +194,57 @@ class Maintenance:
     updated_at: datetime | None
     shortlink: str | None
 
+    @classmethod
+    def try_from_api(cls, data: dict[str, Any]) -> "Maintenance | None":
+        """Parse Maintenance from API response; returns None for malformed records."""
+        return _try_parse(cls.from_api, data)
+
     @classmethod
     def from_api(cls, data: dict[str, Any]) -> "Maintenance":
         """Parse Maintenance from API response."""
-        from dateutil import parser
-
-        scheduled_for = None
-        scheduled_until = None
-        created_at = None
-        updated_at = None
-
-        for field, var in [
-            ("scheduled_for", "scheduled_for"),
-            ("scheduled_until", "scheduled_until"),
-            ("created_at", "created_at"),
-            ("updated_at", "updated_at"),
-        ]:
-            if data.get(field):
-                try:
-                    locals()[var] = parser.parse(data[field])
-                except Exception:
-                    pass
-
         return cls(
-            id=data.get("id", ""),
-            name=data.get("name", "Unnamed Maintenance"),
-            status=data.get("status", ""),
-            impact=data.get("impact", ""),
-            scheduled_for=scheduled_for,
-            scheduled_until=scheduled_until,
-            created_at=created_at,
-            updated_at=updated_at,
+            id=_str_field(data, "id"),
+            name=_str_field(data, "name", "Unnamed Maintenance"),
+            status=_str_field(data, "status"),
+            impact=_str_field(data, "impact"),
+            scheduled_for=_parse_iso(data.get("scheduled_for")),
+            scheduled_until=_parse_iso(data.get("scheduled_until")),
+            created_at=_parse_iso(data.get("created_at")),
+            updated_at=_parse_iso(data.get("updated_at")),
             shortlink=data.get("shortlink"),
         )
+
+
+@dataclass(slots=True)
+class StatusSnapshot:
+    """Bundle of parsed responses from a single refresh of every endpoint."""
+
+    summary: dict[str, Any] | None
+    components: list[Component]
+    incidents: list[Incident]
+    active_maintenance: list[Maintenance]
+    upcoming_maintenance: list[Maintenance]
+    all_maintenance: list[Maintenance]
+
+
+@dataclass(slots=True)
+class StatusMatrix:
+    """
+    Flat region × service status matrix for every cloud.
+
+    Parallel lists hold one entry per (cloud, region, service) cell, sorted by cloud,
+    then region, then canonical service order. cloud_offsets maps each cloud to the
+    [start, end) range of its entries.
+
+    cloud_order lists clouds in display order; regions_by_cloud and services_by_cloud
+    hold each cloud's sorted row and column headers, including regions with no cells.
+    """
+
+    clouds: list[str]
+    regions: list[str]
+    services: list[str]
+    components: list[Component]
+    cloud_offsets: dict[str, tuple[int, int]]
+    cloud_order: list[str]
+    regions_by_cloud: dict[str, list[str]]
+    services_by_cloud: dict[str, list[str]]
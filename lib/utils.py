@@ -2,15 +2,37 @@
 
 from __future__ import annotations
 
-import re
+import functools
+import sys
 from collections.abc import Iterable
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
+import streamlit as st
 import yaml
 
-from .config import StatusType
-from .models import Component
+from .config import DEFAULT_REFRESH_INTERVAL, StatusType
+from .models import Component, StatusMatrix
+
+# Prefer RE2 (linear-time matching) when google-re2 is installed; the stdlib is the fallback
+try:
+    import re2 as _re
+except ImportError:
+    import re as _re
+
+# Cloud - Region - Service component name pattern, compiled once at import.
+# Case-insensitivity is inline because re2.compile does not take stdlib flags.
+_COMPONENT_RE = _re.compile(r"(?i)^(AWS|Azure|GCP)\s*-\s*([^-]+?)(?:\s*-\s*(.+))?$")
+
+# Relative timestamp thresholds
+_MINUTE = 60  # seconds
+_ONE_DAY = timedelta(days=1)
+_TWO_DAYS = timedelta(days=2)
+_WEEK = timedelta(days=7)
+
+# Lowercase cloud prefix -> canonical cloud name
+_CLOUD_PREFIXES = (("aws", "AWS"), ("azure", "AZURE"), ("gcp", "GCP"))
+_CLOUD_INITIALS = frozenset("AaGg")
 
 # Legacy parsing functions (kept for backward compatibility and tests)
 # NOTE: These are replaced by build_status_matrix for the new group-based API structure
@@ -32,7 +54,8 @@ def parse_component_info(component: Component) -> tuple[str | None, str | None,
     name = component.name
 
     # Try to match pattern: Cloud - Region - Service
-    match = re.match(r"^(AWS|Azure|GCP)\s*-\s*([^-]+?)(?:\s*-\s*(.+))?$", name, re.IGNORECASE)
+    # Only names starting with A(WS/zure) or G(CP) can match, so skip the regex otherwise
+    match = _COMPONENT_RE.match(name) if name[:1] in _CLOUD_INITIALS else None
     if match:
         cloud = match.group(1).upper()
         region = match.group(2).strip()
@@ -40,13 +63,12 @@ def parse_component_info(component: Component) -> tuple[str | None, str | None,
         return cloud, region, service
 
     # Fallback: try to identify cloud anywhere in name
-    cloud = None
-    for c in ["AWS", "Azure", "GCP"]:
-        if c.lower() in name.lower():
-            cloud = c.upper()
-            break
+    lowered = name.lower()
+    for needle, cloud in _CLOUD_PREFIXES:
+        if needle in lowered:
+            return cloud, None, None
 
-    return cloud, None, None
+    return None, None, None
 
 
 def group_components_by_cloud(
@@ -82,44 +104,53 @@ def group_components_by_cloud(
     return grouped
 
 
-def format_timestamp(dt: datetime | None, relative: bool = True) -> str:
+def format_timestamp(
+    dt: datetime | None,
+    relative: bool = True,
+    now: datetime | None = None,
+) -> str:
     """
     Format datetime in user's local timezone.
 
     Args:
         dt: Datetime to format
         relative: If True, show relative time for recent timestamps
+        now: Reference time for relative formatting; pass one value when formatting
+            many timestamps in a single render
 
     Returns: Formatted string like "2 minutes ago" or "2024-01-15 10:30 AM PST"
     """
     if dt is None:
         return "Unknown"
 
-    # Convert to local timezone
-    local_dt = dt.astimezone()
+    # Naive datetimes are taken as local time, as astimezone() does
+    if dt.tzinfo is None:
+        dt = dt.astimezone()
 
     if relative:
-        now = datetime.now(UTC).astimezone()
-        delta = now - local_dt
-
-        if delta.days < 0:
-            return local_dt.strftime("%b %d, %Y %I:%M %p %Z")
-
-        if delta.days == 0:
-            if delta.seconds < 60:
+        # Aware datetimes subtract correctly across zones; no local conversion needed
+        if now is None:
+            now = datetime.now(UTC)
+        delta = now - dt
+        seconds = delta.total_seconds()
+
+        if seconds < 0:
+            pass  # Future timestamps are shown in full
+        elif delta < _ONE_DAY:
+            if seconds < _MINUTE:
                 return "Just now"
-            elif delta.seconds < 3600:
-                mins = delta.seconds // 60
+            hours, remainder = divmod(int(seconds), 3600)
+            if not hours:
+                mins = remainder // _MINUTE
                 return f"{mins} minute{'s' if mins != 1 else ''} ago"
-            else:
-                hours = delta.seconds // 3600
-                return f"{hours} hour{'s' if hours != 1 else ''} ago"
-        elif delta.days == 1:
+            return f"{hours} hour{'s' if hours != 1 else ''} ago"
+        elif delta < _TWO_DAYS:
             return "Yesterday"
-        elif delta.days < 7:
+        elif delta < _WEEK:
             return f"{delta.days} days ago"
 
-    return local_dt.strftime("%b %d, %Y %I:%M %p %Z")
+    # Convert to local timezone only for absolute output, using that date's offset
+    return dt.astimezone().strftime("%b %d, %Y %I:%M %p %Z")
 
 
 def aggregate_component_status(components: list[Component]) -> StatusType:
@@ -150,40 +181,103 @@ def build_component_lookup(components: list[Component]) -> dict[str, Component]:
 
 def extract_cloud_from_name(name: str) -> str | None:
     """Extract cloud provider from region name."""
-    match = re.match(r"^(AWS|Azure|GCP)\s*-", name, re.IGNORECASE)
-    return match.group(1).upper() if match else None
-
-
-def build_status_matrix(
-    components: list[Component],
-) -> dict[str, dict[str, dict[str, Component]]]:
+    # Equivalent to matching r"^(AWS|Azure|GCP)\s*-" case-insensitively
+    head = name[:5].lower()
+    for prefix, cloud in _CLOUD_PREFIXES:
+        if head.startswith(prefix) and name[len(prefix) :].lstrip().startswith("-"):
+            return cloud
+    return None
+
+
+def _component_cache_key(component: Component) -> tuple:
+    """Hash only the fields that affect the matrix, instead of the whole dataclass."""
+    return (
+        component.id,
+        component.name,
+        component.status.value,
+        component.updated_at,
+        component.group,
+        component.components,
+    )
+
+
+# Cached by reference across reruns; callers must treat the matrix as read-only.
+@st.cache_resource(
+    ttl=DEFAULT_REFRESH_INTERVAL,
+    show_spinner=False,
+    hash_funcs={Component: _component_cache_key},
+)
+def build_status_matrix(components: list[Component]) -> StatusMatrix:
     """
-    Build matrix structure: {cloud: {region: {service: Component}}}.
+    Build a flat StatusMatrix of (cloud, region, service) -> Component cells.
 
     Uses group components as regions, resolves child IDs to get services.
+    Rebuilt only when the component data changes, not on every rerun.
     """
-    lookup = build_component_lookup(components)
-    matrix: dict[str, dict[str, dict[str, Component]]] = {}
-
-    regions = [c for c in components if c.group]
+    # One pass splits regions (groups) from services; only services are looked up by ID
+    regions: list[Component] = []
+    services: dict[str, Component] = {}
+    for comp in components:
+        if comp.group:
+            regions.append(comp)
+        else:
+            services[comp.id] = comp
 
+    cells_by_cloud: dict[str, dict[tuple[str, str], Component]] = {}
+    region_names_by_cloud: dict[str, set[str]] = {}
     for region in regions:
         cloud = extract_cloud_from_name(region.name)
         if not cloud:
             continue
 
-        if cloud not in matrix:
-            matrix[cloud] = {}
-
-        region_name = region.name
-        matrix[cloud][region_name] = {}
-
-        if region.components:
-            for comp_id in region.components:
-                service_comp = lookup.get(comp_id)
-                if service_comp:
-                    service_name = service_comp.name
-                    matrix[cloud][region_name][service_name] = service_comp
+        # Interned so every cell of a region/service shares one string object across
+        # the cached matrix; cloud names are already interned literals
+        region_name = sys.intern(region.name)
+
+        # Regions without resolvable services still get a row of "no data" cells
+        region_names_by_cloud.setdefault(cloud, set()).add(region_name)
+        cells = cells_by_cloud.setdefault(cloud, {})
+        for comp_id in region.components:
+            service_comp = services.get(comp_id)
+            if service_comp:
+                cells[(region_name, sys.intern(service_comp.name))] = service_comp
+
+    matrix = StatusMatrix(
+        clouds=[],
+        regions=[],
+        services=[],
+        components=[],
+        cloud_offsets={},
+        cloud_order=sorted(cells_by_cloud),
+        regions_by_cloud={},
+        services_by_cloud={},
+    )
+
+    # Order every service once; each cloud's columns are a filtered view of it, which
+    # keeps canonical-then-alphabetical order without re-ranking per cloud
+    service_order = order_services(
+        {service for cells in cells_by_cloud.values() for _, service in cells}
+    )
+    rank = {service: idx for idx, service in enumerate(service_order)}
+
+    for cloud in matrix.cloud_order:
+        cells = cells_by_cloud[cloud]
+
+        # Headers are sorted here once so the renderer only walks them
+        cloud_services = {service for _, service in cells}
+        matrix.regions_by_cloud[cloud] = sorted(region_names_by_cloud[cloud])
+        matrix.services_by_cloud[cloud] = [s for s in service_order if s in cloud_services]
+
+        # Sort cells by region, then by the column order the renderer uses
+        start = len(matrix.components)
+        for (region_name, service_name), comp in sorted(
+            cells.items(), key=lambda item: (item[0][0], rank[item[0][1]])
+        ):
+            matrix.clouds.append(cloud)
+            matrix.regions.append(region_name)
+            matrix.services.append(service_name)
+            matrix.components.append(comp)
+        matrix.cloud_offsets[cloud] = (start, len(matrix.components))
 
     return matrix
 
@@ -192,18 +286,29 @@ def build_status_matrix(
 
 _DEF_SERVICES_PATH = Path(".streamlit/services_order.yaml")
 
+# libyaml-backed loader when PyYAML was built with it; same safe semantics as safe_load
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_canonical_services_cached(path_str: str, mtime: float) -> tuple[str, ...]:
+    """
+    Parse the services YAML; cached per path and modification time.
+
+    Errors propagate so lru_cache doesn't keep a failed read for this mtime.
+    """
+    with open(path_str, encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_YAML_LOADER) or {}
+    services = data.get("services", [])
+    return tuple(s for s in services if isinstance(s, str) and s.strip())
+
 
-def load_canonical_services(path: Path = _DEF_SERVICES_PATH) -> list[str]:
-    """Load canonical services list from YAML; returns empty list on failure."""
+def load_canonical_services(path: Path = _DEF_SERVICES_PATH) -> tuple[str, ...]:
+    """Load canonical services list from YAML; returns empty tuple on failure."""
     try:
-        if not path.exists():
-            return []
-        with path.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
-        services = data.get("services", [])
-        return [s for s in services if isinstance(s, str) and s.strip()]
+        return _load_canonical_services_cached(str(path), path.stat().st_mtime)
     except Exception:
-        return []
+        return ()
 
 
 def order_services(all_services: Iterable[str]) -> list[str]:
@@ -211,16 +316,11 @@ def order_services(all_services: Iterable[str]) -> list[str]:
     Return services ordered with canonical first, then unknown services appended alphabetically.
     """
     canonical = load_canonical_services()
-    seen = set()
+    services = all_services if isinstance(all_services, (set, frozenset)) else set(all_services)
 
     # Preserve canonical order (exact string match only)
-    ordered: list[str] = []
-    for s in canonical:
-        if s in all_services:
-            ordered.append(s)
-            seen.add(s)
+    ordered = [s for s in canonical if s in services]
 
     # Append unknowns alphabetically at the end
-    unknowns = sorted([s for s in all_services if s not in seen])
-    ordered.extend(unknowns)
+    ordered.extend(sorted(services.difference(ordered)))
     return ordered
@@ -1,11 +1,11 @@
 """Main entry point for Accessible Snowflake Status app."""
 
-import time
-
 import streamlit as st
+from streamlit_autorefresh import st_autorefresh
 
-from lib.api import SnowflakeStatusAPI
+from lib.api import get_api
 from lib.components import (
+    render_custom_css,
     render_global_status_banner,
     render_maintenance_banner,
     render_status_legend,
@@ -43,36 +43,8 @@ with col2:
     st.title("SnowStat")
     st.caption("Snowflake operational health, made visually clear for everyone.")
 
-# Inject custom CSS to style cloud tabs (wider, larger text, borders, active highlight)
-st.markdown(
-    """
-    <style>
-    /* Make the tab list fill width and add spacing */
-    div[data-testid="stTabs"] > div[role="tablist"] {
-        gap: 12px;
-    }
-    /* Base tab button style */
-    div[data-testid="stTabs"] button[role="tab"] {
-        flex: 1 1 0;
-        justify-content: center;
-        font-size: 16px;             /* per selection */
-        font-weight: 600;
-        padding: 10px 16px;          /* larger touch target */
-        border: 1.5px solid rgba(0, 0, 0, 0.15);
-        border-radius: 10px;
-        background: transparent;
-        color: inherit;              /* respect theme text color */
-    }
-    /* Active tab: fixed Snowflake blue background + white text */
-    div[data-testid="stTabs"] button[role="tab"][aria-selected="true"] {
-        background-color: #29B5E8;
-        color: #ffffff !important;
-        border-color: #29B5E8;
-    }
-    </style>
-    """,
-    unsafe_allow_html=True,
-)
+# Custom CSS styles the cloud selector as tabs
+render_custom_css()
 
 st.divider()
 
@@ -149,20 +121,27 @@ with st.sidebar:
 
 # Content: Single-page Status view
 view_mode = st.session_state.get("view_mode")
-api = SnowflakeStatusAPI()
+api = get_api()
 
-# Subtle indicator when refreshing is enabled
+# Subtle indicator when refreshing is enabled; the browser schedules the next rerun
+# so the script finishes immediately instead of sleeping on the worker thread
 if st.session_state.get("auto_refresh_enabled", False):
+    st_autorefresh(
+        interval=st.session_state.get("refresh_interval", DEFAULT_REFRESH_INTERVAL) * 1000,
+        key="auto_refresh",
+    )
     st.caption("🔄 Refreshing enabled")
 
-# Fetch and render
+# Fetch the endpoints this page renders concurrently; incidents aren't shown here
 try:
-    summary = api.get_summary()
-    components = api.get_components()
-    active_maintenance = api.get_active_maintenance()
+    snapshot = api.prefetch_all(include_incidents=False)
+    summary = snapshot.summary
+    components = snapshot.components
+    active_maintenance = snapshot.active_maintenance
 except Exception as e:
     st.error(f"Failed to load status data: {str(e)}")
     if st.button("🔄 Retry"):
+        api.clear_cache()
         st.rerun()
     st.stop()
 
@@ -174,24 +153,23 @@ st.divider()
 
 # Build and render matrix
 matrix = build_status_matrix(components)
-if not matrix:
+if not matrix.cloud_order:
     st.warning("No component data available at this time.")
     if st.button("🔄 Refresh"):
+        api.clear_cache()
         st.rerun()
     st.stop()
 
-clouds = ["AWS", "AZURE", "GCP"]
-available_clouds = [c for c in clouds if c in matrix]
-if not available_clouds:
-    st.info("No cloud components found")
-else:
-    tabs = st.tabs(available_clouds)
-    for idx, cloud in enumerate(available_clouds):
-        with tabs[idx]:
-            st.markdown(f"### {cloud} Status")
-            render_status_matrix(matrix[cloud], view_mode, cloud)
-
-# Auto-refresh loop
-if st.session_state.get("auto_refresh_enabled", False):
-    time.sleep(st.session_state.get("refresh_interval", DEFAULT_REFRESH_INTERVAL))
-    st.rerun()
+# Tabs execute every body on each rerun, so select one cloud and render only that matrix
+available_clouds = matrix.cloud_order
+if st.session_state.get("active_cloud") not in available_clouds:
+    st.session_state.active_cloud = available_clouds[0]
+cloud = st.radio(
+    "Cloud",
+    options=available_clouds,
+    key="active_cloud",
+    horizontal=True,
+    label_visibility="collapsed",
+)
+st.markdown(f"### {cloud} Status")
+render_status_matrix(matrix, view_mode, cloud)